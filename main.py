@@ -1,10 +1,18 @@
 # -*- coding: utf-8 -*-
-import sys, os, re, json
+import sys, os, re, json, hashlib, struct, zlib, threading
+from functools import lru_cache
 from PyQt5 import QtWidgets, QtGui, QtCore
+import PIL
 from PIL import Image, ImageDraw, ImageFont
 
 APP_TITLE = "Zelda Text Tool 1.00 — Safe Tags + Bold + Pixel Mode Fix"
 CONFIG_FILE = "zelda_text_tool_config.json"
+METRICS_DIR = "zelda_text_tool_metrics"
+METRICS_FORMAT = 1
+DEFAULT_FONT = "C:/Windows/Fonts/malgun.ttf"
+STREAM_MIN_PIXELS = 2048 * 2048   # 작업 캔버스가 이 이상이면 밴드 단위로 합성/인코딩
+STREAM_BAND_PIXELS = 1 << 22      # 밴드 캔버스 하나의 픽셀 예산 (RGBA 16 MiB)
+BATCH_MEMORY_BUDGET = 1 << 31     # 일괄 렌더에서 동시에 처리 중인 이미지들의 예상 메모리 합 (2 GiB)
 
 # =========================================================
 # Config helpers
@@ -36,20 +44,173 @@ def parse_tokens(text: str):
     parts = TAG_SPLIT.split(text)
     return [p for p in parts if p != ""]
 
+def _font_sig(path: str):
+    """폰트 파일 (mtime, 크기). 같은 경로의 파일이 바뀌면 캐시도 새로 만든다."""
+    try:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return None
+
+@lru_cache(maxsize=64)
+def _load_font(path: str, size: int, sig):
+    return ImageFont.truetype(path, size)
+
 def get_font(path: str, size: int):
-    base = path or "C:/Windows/Fonts/malgun.ttf"
-    return ImageFont.truetype(base, int(size))
+    base = path or DEFAULT_FONT
+    return _load_font(base, int(size), _font_sig(base))
+
+# =========================================================
+# Font metrics table
+# =========================================================
+@lru_cache(maxsize=None)
+def _font_hash(path: str, sig):
+    """폰트 파일 내용의 sha1. 파일을 직접 열 수 없으면 None (디스크 캐시 생략)."""
+    if sig is None:
+        return None
+    try:
+        h = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        return h.hexdigest()
+    except OSError:
+        return None
+
+
+class FontMetrics:
+    """
+    (폰트, 크기) 하나에 대한 advance / 커닝 / 잉크 높이 테이블.
+    글자는 처음 쓰일 때 채우고, 폰트 해시 기준으로 METRICS_DIR 에 저장한다.
+    advance/커닝은 Pillow 버전과 레이아웃 엔진(basic/raqm)에 따라 달라지므로
+    파일 헤더가 현재 환경과 다르면 캐시를 버리고 새로 채운다.
+    """
+
+    def __init__(self, path: str, size: int):
+        sig = _font_sig(path)
+        self.font = _load_font(path, int(size), sig)
+        self.glyphs = {}   # ch -> [advance, top, bottom]
+        self.kern = {}     # "ab" -> advance 보정값
+        self.dirty = False
+        self.header = {
+            "format": METRICS_FORMAT,
+            "pillow": PIL.__version__,
+            "engine": int(self.font.layout_engine),
+        }
+        digest = _font_hash(path, sig)
+        self.cache_path = (os.path.join(METRICS_DIR, f"{digest}_{int(size)}.json")
+                           if digest else None)
+        self._load()
+
+    def _load(self):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("header") != self.header:
+                return
+            self.glyphs = data.get("glyphs", {})
+            self.kern = data.get("kern", {})
+        except Exception:
+            self.glyphs, self.kern = {}, {}
+
+    def save(self):
+        # 다른 스레드가 테이블을 채우는 중일 수 있으므로 잠근 채 스냅샷만 뜬다
+        with _METRICS_LOCK:
+            if not self.dirty or not self.cache_path:
+                return
+            data = {"header": self.header,
+                    "glyphs": dict(self.glyphs), "kern": dict(self.kern)}
+            self.dirty = False
+        try:
+            os.makedirs(METRICS_DIR, exist_ok=True)
+            tmp = f"{self.cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, self.cache_path)
+        except Exception:
+            self.dirty = True
+            raise
+
+    def glyph(self, ch: str):
+        g = self.glyphs.get(ch)
+        if g is None:
+            x0, y0, x1, y1 = self.font.getbbox(ch)
+            g = [self.font.getlength(ch), y0, y1]
+            with _METRICS_LOCK:
+                self.glyphs[ch] = g
+                self.dirty = True
+        return g
+
+    def kerning(self, a: str, b: str):
+        pair = a + b
+        k = self.kern.get(pair)
+        if k is None:
+            k = self.font.getlength(pair) - self.glyph(a)[0] - self.glyph(b)[0]
+            with _METRICS_LOCK:
+                self.kern[pair] = k
+                self.dirty = True
+        return k
+
+    def run_width(self, text: str):
+        """장평 적용 전 advance 폭 (float)."""
+        w = 0.0
+        prev = None
+        for ch in text:
+            w += self.glyph(ch)[0]
+            if prev is not None:
+                w += self.kerning(prev, ch)
+            prev = ch
+        return w
+
+    def run_height(self, text: str):
+        """잉크 높이 (textbbox 높이와 동일). 공백만 있으면 0."""
+        top, bottom = None, None
+        for ch in text:
+            _, y0, y1 = self.glyph(ch)
+            if y1 <= y0:
+                continue
+            top = y0 if top is None else min(top, y0)
+            bottom = y1 if bottom is None else max(bottom, y1)
+        return 0 if top is None else bottom - top
+
+
+_METRICS = {}
+_METRICS_LOCK = threading.RLock()
+
+def get_metrics(path: str, size: int):
+    base = path or DEFAULT_FONT
+    key = (base, int(size), _font_sig(base))
+    m = _METRICS.get(key)
+    if m is None:
+        m = FontMetrics(base, int(size))
+        with _METRICS_LOCK:
+            m = _METRICS.setdefault(key, m)
+    return m
+
+def save_metrics_cache():
+    """새로 채워진 메트릭 테이블만 디스크에 기록."""
+    with _METRICS_LOCK:
+        tables = list(_METRICS.values())
+    for m in tables:
+        m.save()
 
 # -------------------- Measure line --------------------
 def measure_line(draw, text, base_size, font_paths, stretch=1.0):
-    """태그를 해석해서 한 줄의 폭/높이만 계산 (볼드/그림자는 폭에 영향 X)."""
+    """
+    태그를 해석해서 한 줄의 폭/높이만 계산 (볼드/그림자는 폭에 영향 X).
+    래스터화 없이 FontMetrics 테이블만 사용하며, 폭은 render_line 의
+    커서 이동과 같은 방식(장평 적용 float 누적 후 반올림)으로 계산한다.
+    draw 는 호환용 인자로 사용하지 않는다.
+    """
     f1, f2 = font_paths
-    cur_font_path = f1 or "C:/Windows/Fonts/malgun.ttf"
+    cur_font_path = f1 or DEFAULT_FONT
     cur_size = base_size
     cur_stretch = stretch
-    cur_font = get_font(cur_font_path, cur_size)
+    cur_metrics = get_metrics(cur_font_path, cur_size)
 
-    total_w = 0
+    pen = 0.0
     max_h = 0
 
     for tk in parse_tokens(text):
@@ -61,12 +222,12 @@ def measure_line(draw, text, base_size, font_paths, stretch=1.0):
                 m = re.findall(r"\d+", tag)
                 if m:
                     cur_size = int(m[0])
-                    cur_font = get_font(cur_font_path, cur_size)
+                    cur_metrics = get_metrics(cur_font_path, cur_size)
                 continue
 
             if tag == "/size":
                 cur_size = base_size
-                cur_font = get_font(cur_font_path, cur_size)
+                cur_metrics = get_metrics(cur_font_path, cur_size)
                 continue
 
             if tag.startswith("font"):
@@ -75,12 +236,12 @@ def measure_line(draw, text, base_size, font_paths, stretch=1.0):
                     cur_font_path = f2 or cur_font_path
                 else:
                     cur_font_path = f1 or cur_font_path
-                cur_font = get_font(cur_font_path, cur_size)
+                cur_metrics = get_metrics(cur_font_path, cur_size)
                 continue
 
             if tag == "/font":
                 cur_font_path = f1 or cur_font_path
-                cur_font = get_font(cur_font_path, cur_size)
+                cur_metrics = get_metrics(cur_font_path, cur_size)
                 continue
 
             if tag.startswith("stretch"):
@@ -102,16 +263,12 @@ def measure_line(draw, text, base_size, font_paths, stretch=1.0):
         # 실제 텍스트
         if not tk:
             continue
-        x0, y0, x1, y1 = draw.textbbox((0, 0), tk, font=cur_font)
-        w = int((x1 - x0) * cur_stretch)
-        h = y1 - y0
-        total_w += w
-        max_h = max(max_h, h)
+        pen += cur_metrics.run_width(tk) * cur_stretch
+        max_h = max(max_h, cur_metrics.run_height(tk))
 
     if max_h == 0:
-        x0, y0, x1, y1 = draw.textbbox((0, 0), "A", font=get_font(cur_font_path, base_size))
-        max_h = y1 - y0
-    return total_w, max_h
+        max_h = get_metrics(cur_font_path, base_size).run_height("A")
+    return round(pen), max_h
 
 # -------------------- Render line --------------------
 def render_line(draw, text, base_size, font_paths,
@@ -124,14 +281,16 @@ def render_line(draw, text, base_size, font_paths,
     - bold_px: 굵게 채우기 반경(px)
     - shadow: (dx, dy, color) or None
     - stretch: 장평 (x축 스케일)
+    반환값: 커서가 이동한 폭 (measure_line 의 폭과 같음)
     """
     f1, f2 = font_paths
-    cur_font_path = f1 or "C:/Windows/Fonts/malgun.ttf"
+    cur_font_path = f1 or DEFAULT_FONT
     cur_size = base_size
     cur_stretch = stretch
     cur_font = get_font(cur_font_path, cur_size)
 
-    cursor_x = x
+    # 커서는 float 로 누적하고 그릴 때만 반올림 (measure_line 과 동일한 규칙)
+    pen = 0.0
     tokens = parse_tokens(text)
 
     # 전역 bold 여부 (슬라이더 값이 0이면 기본은 False)
@@ -212,6 +371,9 @@ def render_line(draw, text, base_size, font_paths,
         effective_bold = bold_px if bold_on and bold_px > 0 else 0
 
         # 공통: glyph 생성 + stretch 적용
+        cursor_x = x + round(pen)
+        pen += get_metrics(cur_font_path, cur_size).run_width(tk) * cur_stretch
+
         glyph, w0, h0 = glyph_from_text(tk)
         if glyph is None or w0 == 0 or h0 == 0:
             continue
@@ -246,7 +408,6 @@ def render_line(draw, text, base_size, font_paths,
 
             # 본문
             draw.bitmap((cursor_x, y), glyph_bw, fill)
-            cursor_x += new_w
             continue
 
         # ===== 일반(AA) 렌더 =====
@@ -275,7 +436,407 @@ def render_line(draw, text, base_size, font_paths,
 
         # 본문
         draw.bitmap((cursor_x, y), glyph_scaled, fill)
-        cursor_x += new_w
+
+    return round(pen)
+
+
+# =========================================================
+# Compose (위젯 없이 설정 dict 만으로 합성)
+# =========================================================
+def layout_text(W, H, txt, opts):
+    """
+    W×H 이미지에 대한 줄 배치만 계산 (래스터화 없음).
+    텍스트가 비어 있으면 None.
+    """
+    txt = (txt or "").strip()
+    if not txt:
+        return None
+
+    px_mode = opts["pixel_mode"]
+    SCALE = 4 if px_mode else 1
+    cw, ch = W * SCALE, H * SCALE
+
+    font_paths = tuple(opts["font_paths"])
+    base_size = int(opts["font_size"]) * SCALE
+    line_mul = opts["line_spacing"]
+    scale_x = opts["scale_x"]
+    offx = opts["offx"] * SCALE
+    offy = opts["offy"] * SCALE
+    align = opts["align"]
+
+    # 그림자
+    shadow_tuple = None
+    if opts["shadow"] is not None:
+        dx, dy, scol = opts["shadow"]
+        if dx != 0 or dy != 0:
+            shadow_tuple = (dx * SCALE, dy * SCALE, scol)
+
+    # 줄 폭/높이 계산
+    lines = txt.split("\n")
+    widths, heights = [], []
+    for ln in lines:
+        w, h = measure_line(None, ln, base_size, font_paths, stretch=scale_x)
+        widths.append(w)
+        heights.append(h)
+    total_h = sum(heights) * line_mul if heights else 0
+
+    cx = (cw // 2) + offx
+    cy = (ch // 2) + offy
+    y_cursor = cy - int(total_h // 2)
+
+    placed = []
+    for i, ln in enumerate(lines):
+        lw, lh = widths[i], heights[i]
+        if align == "왼쪽":
+            lx = cx - (cw // 2) + (5 * SCALE)
+        elif align == "오른쪽":
+            lx = cx + (cw // 2) - lw - (5 * SCALE)
+        else:
+            lx = cx - (lw // 2)
+        placed.append((ln, lx, y_cursor, lh))
+        y_cursor += int(lh * line_mul)
+
+    # 외곽선/볼드/그림자/글리프 여유분 (밴드 교차 판정용)
+    pad = opts["outline"] + opts["bold_px"] + base_size
+    if shadow_tuple is not None:
+        pad += max(abs(shadow_tuple[0]), abs(shadow_tuple[1]))
+
+    return {
+        "W": W, "H": H, "scale": SCALE, "px_mode": px_mode,
+        "font_paths": font_paths, "base_size": base_size, "stretch": scale_x,
+        "shadow": shadow_tuple, "pad": pad, "lines": placed,
+    }
+
+def render_text_band(layout, opts, y0, y1):
+    """
+    layout 의 [y0, y1) 행만 (W × (y1-y0)) RGBA 로 렌더.
+    밴드와 겹치는 줄만 그리므로 캔버스 크기는 밴드 높이에만 비례한다.
+    """
+    W, SCALE = layout["W"], layout["scale"]
+    px_mode = layout["px_mode"]
+    top, bottom = y0 * SCALE, y1 * SCALE
+    pad = layout["pad"]
+
+    canvas = Image.new("RGBA", (W * SCALE, bottom - top), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(canvas)
+
+    for ln, lx, ly, lh in layout["lines"]:
+        if ly + lh + pad <= top or ly - pad >= bottom:
+            continue
+        render_line(
+            draw, ln, layout["base_size"], layout["font_paths"],
+            lx, ly - top,
+            fill=tuple(opts["text_color"]),
+            outline_px=opts["outline"],
+            outline_color=tuple(opts["outline_color"]),
+            shadow=layout["shadow"],
+            px_mode=px_mode,
+            stretch=layout["stretch"],
+            bold_px=opts["bold_px"],
+        )
+
+    return canvas.resize((W, y1 - y0), Image.NEAREST if px_mode else Image.BILINEAR)
+
+def compose_text_image(W, H, txt, opts, boss_bottom=None):
+    """
+    텍스트를 W×H RGBA 이미지로 합성.
+    - opts: ZeldaTextTool._render_options() 가 만드는 설정 dict
+    - boss_bottom: 보스 카드 모드에서 붙일 원본 하단 crop (없으면 텍스트만)
+    """
+    layout = layout_text(W, H, txt, opts)
+    if layout is None:
+        return Image.new("RGBA", (W, H), (0, 0, 0, 0))
+
+    # 보스 카드 모드: 상단만 덮어쓰기
+    if opts["boss_mode"] and boss_bottom is not None:
+        top_h = H // 2
+        merged = Image.new("RGBA", (W, H), (0, 0, 0, 0))
+        merged.paste(render_text_band(layout, opts, 0, top_h), (0, 0))
+        merged.paste(boss_bottom.convert("RGBA"), (0, top_h))
+        return merged
+
+    return render_text_band(layout, opts, 0, H)
+
+def boss_bottom_crop(base):
+    """보스 카드 모드에서 원본에서 그대로 유지되는 하단 절반 (원본 모드 그대로)."""
+    W, H = base.size
+    return base.crop((0, H // 2, W, H))
+
+def open_boss_bottom(path):
+    """원본 파일에서 하단 절반만 남긴다. RGBA 변환은 쓰는 쪽에서 밴드 단위로."""
+    with Image.open(path) as im:
+        return boss_bottom_crop(im)
+
+# =========================================================
+# Streaming (대형 아틀라스/시트용 밴드 단위 합성)
+# =========================================================
+def _png_chunk(f, tag, data):
+    f.write(struct.pack(">I", len(data)))
+    f.write(tag)
+    f.write(data)
+    f.write(struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+def _work_pixels(W, H, opts):
+    """합성 캔버스 픽셀 수 (픽셀 모드는 4배 해상도에서 그림)."""
+    scale = 4 if opts["pixel_mode"] else 1
+    return W * H * scale * scale
+
+def stream_band_height(W, opts):
+    """밴드 캔버스가 STREAM_BAND_PIXELS 안에 들어가는 행 수."""
+    scale = 4 if opts["pixel_mode"] else 1
+    return max(1, STREAM_BAND_PIXELS // (W * scale * scale))
+
+def iter_text_bands(W, H, txt, opts, boss_bottom=None, band_h=None):
+    """
+    compose_text_image 와 같은 결과를 위에서부터 band_h 행씩 생성.
+    band_h 를 주지 않으면 stream_band_height 로 정한다.
+    """
+    band_h = band_h or stream_band_height(W, opts)
+    layout = layout_text(W, H, txt, opts)
+    top_h = H // 2
+    boss = layout is not None and opts["boss_mode"] and boss_bottom is not None
+
+    for y0 in range(0, H, band_h):
+        y1 = min(H, y0 + band_h)
+        if layout is None:
+            yield Image.new("RGBA", (W, y1 - y0), (0, 0, 0, 0))
+            continue
+        if not boss:
+            yield render_text_band(layout, opts, y0, y1)
+            continue
+        band = Image.new("RGBA", (W, y1 - y0), (0, 0, 0, 0))
+        if y0 < top_h:
+            band.paste(render_text_band(layout, opts, y0, min(y1, top_h)), (0, 0))
+        if y1 > top_h:
+            s0 = max(y0, top_h)
+            src = boss_bottom.crop((0, s0 - top_h, W, y1 - top_h)).convert("RGBA")
+            band.paste(src, (0, s0 - y0))
+        yield band
+
+def save_text_png_streaming(out_path, W, H, txt, opts, boss_bottom=None,
+                            band_h=None):
+    """
+    밴드 단위로 합성하면서 PNG(RGBA8) 로 바로 인코딩.
+    텍스트 캔버스는 밴드 하나 크기만 메모리에 올라간다.
+    """
+    stride = W * 4
+    z = zlib.compressobj(6)
+    with open(out_path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        _png_chunk(f, b"IHDR", struct.pack(">IIBBBBB", W, H, 8, 6, 0, 0, 0))
+        for band in iter_text_bands(W, H, txt, opts, boss_bottom, band_h):
+            raw = band.tobytes("raw", "RGBA")
+            rows = b"".join(b"\x00" + raw[i:i + stride]
+                            for i in range(0, len(raw), stride))
+            data = z.compress(rows)
+            if data:
+                _png_chunk(f, b"IDAT", data)
+        _png_chunk(f, b"IDAT", z.flush())
+        _png_chunk(f, b"IEND", b"")
+
+def save_text_png(out_path, W, H, txt, opts, boss_bottom=None):
+    """캔버스가 STREAM_MIN_PIXELS 이상이면 밴드 스트리밍, 아니면 한 번에 합성해서 저장."""
+    if _work_pixels(W, H, opts) >= STREAM_MIN_PIXELS:
+        save_text_png_streaming(out_path, W, H, txt, opts, boss_bottom)
+    else:
+        compose_text_image(W, H, txt, opts, boss_bottom).save(out_path, "PNG")
+
+def compose_text_preview(W, H, txt, opts, max_w, max_h, boss_bottom=None):
+    """
+    max_w×max_h 안에 들어가는 미리보기. 작은 이미지는 compose_text_image 그대로,
+    큰 이미지는 밴드마다 축소해서 붙이므로 원본 크기 캔버스를 만들지 않는다.
+    """
+    if _work_pixels(W, H, opts) < STREAM_MIN_PIXELS:
+        return compose_text_image(W, H, txt, opts, boss_bottom)
+
+    ratio = min(max_w / W, max_h / H, 1.0)
+    pw, ph = max(1, int(W * ratio)), max(1, int(H * ratio))
+    resample = Image.NEAREST if opts["pixel_mode"] else Image.BILINEAR
+    preview = Image.new("RGBA", (pw, ph), (0, 0, 0, 0))
+    y = 0
+    for band in iter_text_bands(W, H, txt, opts, boss_bottom):
+        ty0, ty1 = y * ph // H, (y + band.height) * ph // H
+        if ty1 > ty0:
+            preview.paste(band.resize((pw, ty1 - ty0), resample), (0, ty0))
+        y += band.height
+    return preview
+
+# =========================================================
+# Multi-locale batch
+# =========================================================
+def load_locale_table(path):
+    """
+    로케일 텍스트 테이블 (JSON: {"파일명.png": "텍스트", ...}).
+    로케일 이름은 파일 이름에서 확장자를 뺀 것 (ko.json → ko).
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        table = json.load(f)
+    return os.path.splitext(os.path.basename(path))[0], table
+
+def batch_image_bytes(W, H, opts):
+    """이미지 하나를 렌더하는 동안의 대략적인 최대 메모리 (byte)."""
+    work = _work_pixels(W, H, opts)
+    if work < STREAM_MIN_PIXELS:
+        need = (work + 2 * W * H) * 4          # 작업 캔버스 + 축소본 + 보스 합성본
+    else:
+        need = STREAM_BAND_PIXELS * 4 * 2      # 밴드 캔버스 + 축소된 밴드
+    if opts["boss_mode"]:
+        need += (W * H + W * (H - H // 2)) * 4  # 원본 전체 디코드 + 하단 crop
+    return need
+
+def _error_text(e):
+    return str(e) or type(e).__name__
+
+def _batch_render_image(src_path, jobs, opts):
+    """
+    이미지 하나를 한 번만 디코드하고, 모든 로케일을 렌더해서 저장.
+    jobs: [(locale, text, out_path), ...]
+    로케일 하나가 실패해도 나머지 로케일은 계속 렌더한다.
+    반환값: (저장된 경로 리스트, [(원본 경로, 로케일, 오류 메시지), ...])
+    """
+    try:
+        with Image.open(src_path) as src:
+            W, H = src.size
+            bottom = boss_bottom_crop(src) if opts["boss_mode"] else None
+    except Exception as e:
+        return [], [(src_path, locale, _error_text(e)) for locale, _, _ in jobs]
+
+    saved, failed = [], []
+    for locale, text, out_path in jobs:
+        try:
+            save_text_png(out_path, W, H, text, opts, boss_bottom=bottom)
+        except Exception as e:
+            failed.append((src_path, locale, _error_text(e)))
+            continue
+        saved.append(out_path)
+    save_metrics_cache()
+    return saved, failed
+
+def render_locale_batch(src_dir, locale_tables, opts, out_root=None, workers=None,
+                        progress=None, cancelled=None, isolate=False,
+                        memory_budget=BATCH_MEMORY_BUDGET):
+    """
+    src_dir 의 PNG 마다 locale_tables 의 각 로케일 텍스트를 렌더해서
+    out_root/<locale>/<파일명> 으로 저장. (기본 out_root = src_dir/output)
+
+    작업 단위는 이미지 하나(모든 로케일 포함)라서 디코드/보스 crop/폰트 캐시를
+    로케일끼리 공유한다. 프로세스는 최대 workers(기본 코어 수)개까지 쓰지만,
+    PNG 헤더의 W×H 로 추정한 batch_image_bytes 합이 memory_budget 을 넘지
+    않을 때만 다음 이미지를 시작한다. 예산보다 큰 이미지는 혼자 처리한다.
+
+    - progress(done, total, src_path): 이미지 하나가 끝날 때마다 호출
+    - cancelled(): True 를 돌려주면 남은 이미지는 시작하지 않음
+    - isolate: workers == 1 이어도 자식 프로세스에서 렌더 (GUI 에서 호출할 때
+      폰트 객체/메트릭 테이블을 GUI 스레드와 공유하지 않도록)
+    (이미지, 로케일) 하나가 실패해도 나머지는 계속 진행한다.
+    반환값: (저장된 파일 경로 리스트, [(원본 경로, 로케일, 오류 메시지), ...])
+    """
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+    out_root = out_root or os.path.join(src_dir, "output")
+    tables = [load_locale_table(p) for p in locale_tables]
+    for locale, _ in tables:
+        os.makedirs(os.path.join(out_root, locale), exist_ok=True)
+
+    tasks = []
+    for name in sorted(os.listdir(src_dir)):
+        if not name.lower().endswith(".png"):
+            continue
+        jobs = [(locale, table[name], os.path.join(out_root, locale, name))
+                for locale, table in tables if name in table]
+        if jobs:
+            tasks.append((os.path.join(src_dir, name), jobs))
+
+    # 미리보기에서 채운 메트릭 테이블을 워커들이 디스크에서 바로 읽도록
+    save_metrics_cache()
+    workers = max(1, workers or os.cpu_count() or 1)
+
+    saved, failed = [], []
+    total = len(tasks)
+    finished = 0
+
+    def collect(src, jobs, result):
+        nonlocal finished
+        try:
+            ok, bad = result()
+        except Exception as e:   # 워커 프로세스 자체가 죽은 경우 등
+            ok, bad = [], [(src, locale, _error_text(e)) for locale, _, _ in jobs]
+        saved.extend(ok)
+        failed.extend(bad)
+        finished += 1
+        if progress:
+            progress(finished, total, src)
+
+    if workers == 1 and not isolate:
+        for src, jobs in tasks:
+            if cancelled and cancelled():
+                break
+            collect(src, jobs, lambda: _batch_render_image(src, jobs, opts))
+        return saved, failed
+
+    def image_bytes(src):
+        try:
+            with Image.open(src) as im:
+                return batch_image_bytes(im.width, im.height, opts)
+        except Exception:
+            return 0   # 열 수 없는 파일은 워커에서 바로 실패로 보고됨
+
+    in_flight = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = {}
+
+        def reap():
+            nonlocal in_flight
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                src, jobs, need = pending.pop(fut)
+                in_flight -= need
+                collect(src, jobs, fut.result)
+
+        for src, jobs in tasks:
+            if cancelled and cancelled():
+                break
+            need = image_bytes(src)
+            # 풀 큐에 쌓아 두지 않고, 실행 중인 것만으로 코어 수/메모리 예산을 맞춘다
+            while pending and (len(pending) >= workers or in_flight + need > memory_budget):
+                reap()
+            pending[pool.submit(_batch_render_image, src, jobs, opts)] = (src, jobs, need)
+            in_flight += need
+        while pending:
+            if cancelled and cancelled():
+                for fut in pending:
+                    fut.cancel()
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                src, jobs, need = pending.pop(fut)
+                if not fut.cancelled():
+                    collect(src, jobs, fut.result)
+    return saved, failed
+
+
+class BatchWorker(QtCore.QThread):
+    """render_locale_batch 를 GUI 스레드 밖에서 실행."""
+    progress = QtCore.pyqtSignal(int, int, str)
+    finished_batch = QtCore.pyqtSignal(list, list)
+    failed_batch = QtCore.pyqtSignal(str)
+
+    def __init__(self, src_dir, locale_tables, opts, parent=None):
+        super().__init__(parent)
+        self.src_dir = src_dir
+        self.locale_tables = locale_tables
+        self.opts = opts
+
+    def run(self):
+        try:
+            saved, failed = render_locale_batch(
+                self.src_dir, self.locale_tables, self.opts,
+                progress=self.progress.emit,
+                cancelled=self.isInterruptionRequested,
+                isolate=True)
+        except Exception as e:
+            self.failed_batch.emit(str(e))
+            return
+        self.finished_batch.emit(saved, failed)
 
 
 # =========================================================
@@ -302,6 +863,7 @@ class ZeldaTextTool(QtWidgets.QWidget):
         self.current_index = -1
         self.image_path = None
         self.image_size = (512, 128)
+        self._batch_worker = None
 
         self._build_ui()
         self._restore_settings()
@@ -380,10 +942,13 @@ class ZeldaTextTool(QtWidgets.QWidget):
 
         self.btn_save = QtWidgets.QPushButton("저장 (Ctrl+S)")
         self.btn_open = QtWidgets.QPushButton("원본 불러오기 (Ctrl+O)")
+        self.btn_batch = QtWidgets.QPushButton("다국어 일괄 렌더")
         self.btn_save.clicked.connect(self.save_image)
         self.btn_open.clicked.connect(lambda: self.load_image())
+        self.btn_batch.clicked.connect(self.batch_render)
         left.addWidget(self.btn_save)
         left.addWidget(self.btn_open)
+        left.addWidget(self.btn_batch)
         left.addStretch(1)
 
         # -------- 미리보기 / 원본 --------
@@ -478,7 +1043,11 @@ class ZeldaTextTool(QtWidgets.QWidget):
         save_config(self.cfg)
 
     def closeEvent(self, e):
+        if self._batch_worker is not None:
+            self._batch_worker.requestInterruption()
+            self._batch_worker.wait()
         self._save_settings()
+        save_metrics_cache()
         e.accept()
 
     # -----------------------------------------------------
@@ -541,12 +1110,14 @@ class ZeldaTextTool(QtWidgets.QWidget):
     def _display_original(self):
         if not self.image_path:
             return
-        im = Image.open(self.image_path).convert("RGBA")
-        self.image_size = im.size
-        pix = QtGui.QPixmap(self.image_path).scaled(
+        with Image.open(self.image_path) as im:
+            self.image_size = im.size
+        # 원본 크기로 디코드하지 않고 라벨 크기로 바로 읽음
+        reader = QtGui.QImageReader(self.image_path)
+        reader.setScaledSize(reader.size().scaled(
             self.lbl_right.width(), self.lbl_right.height(),
-            QtCore.Qt.KeepAspectRatio)
-        self.lbl_right.setPixmap(pix)
+            QtCore.Qt.KeepAspectRatio))
+        self.lbl_right.setPixmap(QtGui.QPixmap.fromImage(reader.read()))
         self._update_status()
 
     def _update_status(self):
@@ -555,12 +1126,22 @@ class ZeldaTextTool(QtWidgets.QWidget):
         w, h = self.image_size
         mark = ""
         if total > 0:
-            cur_path = self.image_list[self.current_index]
-            out = os.path.join(os.path.dirname(cur_path), "output",
-                               os.path.basename(cur_path))
-            mark = " ✅" if os.path.exists(out) else " ·"
+            mark = " ✅" if self._has_output(self.image_list[self.current_index]) else " ·"
         self.status.setText(f"이미지: {cur} / {total} ({w}×{h}){mark}")
 
+    def _has_output(self, path):
+        """output/<파일명> 또는 일괄 렌더의 output/<locale>/<파일명> 이 있으면 True."""
+        out_dir = os.path.join(os.path.dirname(path), "output")
+        name = os.path.basename(path)
+        if os.path.exists(os.path.join(out_dir, name)):
+            return True
+        if not os.path.isdir(out_dir):
+            return False
+        # output/ 에는 단일 저장 PNG 가 많으므로 하위 폴더(로케일)만 본다
+        with os.scandir(out_dir) as it:
+            return any(e.is_dir() and os.path.exists(os.path.join(e.path, name))
+                       for e in it)
+
     def next_image(self, step=1):
         if not self.image_list:
             return
@@ -587,93 +1168,44 @@ class ZeldaTextTool(QtWidgets.QWidget):
     # -----------------------------------------------------
     # Compose preview
     # -----------------------------------------------------
-    def _compose_preview(self, W, H):
-        txt = self.text_edit.toPlainText().strip()
-        if not txt:
-            return Image.new("RGBA", (W, H), (0, 0, 0, 0))
-
-        px_mode = self.chk_pixel.isChecked()
-        SCALE = 4 if px_mode else 1
-        cw, ch = W * SCALE, H * SCALE
-
-        canvas = Image.new("RGBA", (cw, ch), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(canvas)
-
-        base_size = int(self.spin_size.value()) * SCALE
-        line_mul = self.dbl_line.value()
-        outline = self.spin_outline.value()
-        bold_px = self.spin_bold.value()
-        scale_x = self.dbl_scale_x.value()
-        offx = self.spin_offx.value() * SCALE
-        offy = self.spin_offy.value() * SCALE
-        align = self.combo_align.currentText()
-        color = self.text_color
-
-        # 그림자
-        shadow_tuple = None
+    def _render_options(self):
+        """현재 UI 설정을 compose_text_image 용 dict 로."""
+        shadow = None
         if self.chk_shadow.isChecked():
-            spx = max(0, int(self.spin_shadow_px.value())) * SCALE
-            dx, dy = self._shadow_vector(spx)
-            if dx != 0 or dy != 0:
-                shadow_tuple = (dx, dy, self.shadow_color)
-
-        # 줄 폭/높이 계산
-        lines = txt.split("\n")
-        widths, heights = [], []
-        for ln in lines:
-            w, h = measure_line(draw, ln, base_size,
-                                (self.font1_path, self.font2_path),
-                                stretch=scale_x)
-            widths.append(w)
-            heights.append(h)
-        total_h = sum(heights) * line_mul if heights else 0
-
-        cx = (cw // 2) + offx
-        cy = (ch // 2) + offy
-        y_cursor = cy - int(total_h // 2)
-
-        for i, ln in enumerate(lines):
-            lw, lh = widths[i], heights[i]
-            if align == "왼쪽":
-                lx = cx - (cw // 2) + (5 * SCALE)
-            elif align == "오른쪽":
-                lx = cx + (cw // 2) - lw - (5 * SCALE)
-            else:
-                lx = cx - (lw // 2)
-
-            render_line(
-                draw, ln, base_size,
-                (self.font1_path, self.font2_path),
-                lx, y_cursor,
-                fill=color,
-                outline_px=outline,
-                outline_color=self.outline_color,
-                shadow=shadow_tuple,
-                px_mode=px_mode,
-                stretch=scale_x,
-                bold_px=bold_px,
-            )
-            y_cursor += int(lh * line_mul)
-
-        canvas = canvas.resize((W, H), Image.NEAREST if px_mode else Image.BILINEAR)
-
-        # 보스 카드 모드: 상단만 덮어쓰기
-        if self.chk_boss.isChecked() and self.image_path and os.path.exists(self.image_path):
-            base = Image.open(self.image_path).convert("RGBA").copy()
-            top_h = H // 2
-            merged = Image.new("RGBA", (W, H), (0, 0, 0, 0))
-            merged.paste(canvas.crop((0, 0, W, top_h)), (0, 0))
-            merged.paste(base.crop((0, top_h, W, H)), (0, top_h))
-            return merged
+            dx, dy = self._shadow_vector(max(0, int(self.spin_shadow_px.value())))
+            shadow = (dx, dy, self.shadow_color)
+        return {
+            "font_paths": (self.font1_path, self.font2_path),
+            "font_size": self.spin_size.value(),
+            "outline": self.spin_outline.value(),
+            "bold_px": self.spin_bold.value(),
+            "scale_x": self.dbl_scale_x.value(),
+            "line_spacing": self.dbl_line.value(),
+            "align": self.combo_align.currentText(),
+            "offx": self.spin_offx.value(),
+            "offy": self.spin_offy.value(),
+            "pixel_mode": self.chk_pixel.isChecked(),
+            "boss_mode": self.chk_boss.isChecked(),
+            "text_color": self.text_color,
+            "outline_color": self.outline_color,
+            "shadow": shadow,
+        }
 
-        return canvas
+    def _compose_preview(self, W, H):
+        opts = self._render_options()
+        bottom = None
+        if opts["boss_mode"] and self.image_path and os.path.exists(self.image_path):
+            bottom = open_boss_bottom(self.image_path)
+        return compose_text_preview(W, H, self.text_edit.toPlainText(), opts,
+                                    self.lbl_left.width(), self.lbl_left.height(),
+                                    boss_bottom=bottom)
 
     def update_preview(self):
         W, H = self.image_size
         if W <= 0 or H <= 0:
             W, H = (512, 128)
         im = self._compose_preview(W, H)
-        qim = QtGui.QImage(im.tobytes("raw", "RGBA"), W, H,
+        qim = QtGui.QImage(im.tobytes("raw", "RGBA"), im.width, im.height,
                            QtGui.QImage.Format_RGBA8888)
         self.lbl_left.setPixmap(
             QtGui.QPixmap.fromImage(qim).scaled(
@@ -697,11 +1229,73 @@ class ZeldaTextTool(QtWidgets.QWidget):
         out_path = os.path.join(out_dir, os.path.basename(cur_path))
 
         W, H = self.image_size
-        final = self._compose_preview(W, H)
-        final.save(out_path, "PNG")
+        opts = self._render_options()
+        bottom = None
+        if opts["boss_mode"] and os.path.exists(cur_path):
+            bottom = open_boss_bottom(cur_path)
+        save_text_png(out_path, W, H, self.text_edit.toPlainText(), opts,
+                      boss_bottom=bottom)
+        save_metrics_cache()
         QtWidgets.QMessageBox.information(self, "저장 완료", f"저장됨: {out_path}")
         self._update_status()
 
+    # -----------------------------------------------------
+    # Multi-locale batch
+    # -----------------------------------------------------
+    def batch_render(self):
+        start = os.path.dirname(self.image_path) if self.image_path else ""
+        src = QtWidgets.QFileDialog.getExistingDirectory(self, "원본 폴더 선택", start)
+        if not src:
+            return
+        tables, _ = QtWidgets.QFileDialog.getOpenFileNames(
+            self, "로케일 텍스트 테이블 선택", src, "JSON Files (*.json)")
+        if not tables:
+            return
+
+        self.btn_batch.setEnabled(False)
+        self._batch_out = os.path.join(src, "output")
+        self._batch_dialog = QtWidgets.QProgressDialog("일괄 렌더 중...", "취소", 0, 0, self)
+        self._batch_dialog.setWindowTitle("다국어 일괄 렌더")
+        self._batch_dialog.setMinimumDuration(0)
+
+        worker = BatchWorker(src, tables, self._render_options(), self)
+        worker.progress.connect(self._on_batch_progress)
+        worker.finished_batch.connect(self._on_batch_finished)
+        worker.failed_batch.connect(self._on_batch_failed)
+        self._batch_dialog.canceled.connect(worker.requestInterruption)
+        self._batch_worker = worker
+        worker.start()
+
+    def _on_batch_progress(self, done, total, src_path):
+        self._batch_dialog.setMaximum(total)
+        self._batch_dialog.setValue(done)
+        self._batch_dialog.setLabelText(
+            f"일괄 렌더 중... {done} / {total}  ({os.path.basename(src_path)})")
+
+    def _end_batch(self):
+        self._batch_dialog.canceled.disconnect()
+        self._batch_dialog.close()
+        self._batch_worker = None
+        self.btn_batch.setEnabled(True)
+        self._update_status()
+
+    def _on_batch_finished(self, saved, failed):
+        self._end_batch()
+        msg = f"{len(saved)}개 저장됨: {self._batch_out}"
+        if failed:
+            lines = [f"- {os.path.basename(p)} [{locale}]: {err}"
+                     for p, locale, err in failed[:20]]
+            if len(failed) > 20:
+                lines.append(f"... 외 {len(failed) - 20}개")
+            msg += f"\n\n실패 {len(failed)}개:\n" + "\n".join(lines)
+            QtWidgets.QMessageBox.warning(self, "일괄 렌더 완료 (일부 실패)", msg)
+        else:
+            QtWidgets.QMessageBox.information(self, "일괄 렌더 완료", msg)
+
+    def _on_batch_failed(self, err):
+        self._end_batch()
+        QtWidgets.QMessageBox.warning(self, "경고", f"일괄 렌더 실패: {err}")
+
 # =========================================================
 # main
 # =========================================================
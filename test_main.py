@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+import os, sys, types
+import pytest
+
+pytest.importorskip("PIL")
+from PIL import Image, ImageDraw
+
+# GUI 없이 import 할 수 있도록 PyQt5 가 없으면 빈 모듈로 대체
+try:
+    import PyQt5.QtWidgets  # noqa: F401
+except ImportError:
+    _qt = types.ModuleType("PyQt5")
+    for _name in ("QtWidgets", "QtGui", "QtCore"):
+        _mod = types.ModuleType(_name)
+        setattr(_qt, _name, _mod)
+        sys.modules["PyQt5." + _name] = _mod
+    sys.modules["PyQt5"] = _qt
+    _qt.QtWidgets.QWidget = object
+    _qt.QtCore.QThread = object
+    _qt.QtCore.pyqtSignal = lambda *a: None
+
+import main
+
+FONT_CANDIDATES = [
+    os.environ.get("ZELDA_TEST_FONT", ""),
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/dejavu/DejaVuSans.ttf",
+    "/Library/Fonts/Arial.ttf",
+    "C:/Windows/Fonts/malgun.ttf",
+    "C:/Windows/Fonts/arial.ttf",
+]
+FONT = next((p for p in FONT_CANDIDATES if p and os.path.exists(p)), None)
+
+pytestmark = pytest.mark.skipif(FONT is None, reason="테스트용 TTF 없음 (ZELDA_TEST_FONT)")
+
+LINES = [
+    "Hello <size 20>World</size> AVATAR",
+    "<font 2>Gan<stretch 0.8>ondorf</stretch></font> <bold>Wa</bold>ter",
+    "<stretch 1.37>Temple of Time</stretch>",
+]
+
+
+@pytest.fixture(autouse=True)
+def metrics_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "METRICS_DIR", str(tmp_path / "metrics"))
+    main._METRICS.clear()
+
+
+@pytest.mark.parametrize("stretch", [1.0, 1.15, 0.73])
+@pytest.mark.parametrize("px_mode", [False, True])
+def test_measure_matches_render(stretch, px_mode):
+    canvas = Image.new("RGBA", (1024, 128), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(canvas)
+    for ln in LINES:
+        w, _ = main.measure_line(draw, ln, 14, (FONT, FONT), stretch=stretch)
+        pen = main.render_line(draw, ln, 14, (FONT, FONT), 0, 0,
+                               fill=(255, 255, 255), outline_px=1,
+                               outline_color=(0, 0, 0), shadow=None,
+                               px_mode=px_mode, stretch=stretch, bold_px=1)
+        assert w == pen
+
+
+@pytest.mark.parametrize("size", [14, 28, 56])
+def test_measure_matches_font_and_ink(size):
+    font = main.get_font(FONT, size)
+    for ln in ["AVATAR Temple of Time", "Hello, World!", "Water WAVE fly."]:
+        w, _ = main.measure_line(None, ln, size, (FONT, FONT))
+        assert w == round(font.getlength(ln))
+
+        # 잉크 오른쪽 끝은 x + 폭 에서 첫 글자 왼쪽 베어링 + 마지막 글자 오른쪽 베어링
+        # (+ 반올림/안티앨리어싱 2px) 이내
+        mask, (off_x, _) = font.getmask2(ln, mode="L")
+        ink = Image.frombytes("L", mask.size, bytes(mask)).getbbox()
+        bearing_l = off_x + ink[0]
+        bearing_r = font.getlength(ln) - (off_x + ink[2])
+        tol = abs(bearing_l) + abs(bearing_r) + 2
+        for align in ("오른쪽", "가운데"):
+            W = w + 200
+            opts = dict(font_paths=(FONT, FONT), font_size=size, outline=0, bold_px=0,
+                        scale_x=1.0, line_spacing=1.0, align=align, offx=0, offy=0,
+                        pixel_mode=False, boss_mode=False, text_color=(255, 255, 255),
+                        outline_color=(0, 0, 0), shadow=None)
+            im = main.compose_text_image(W, size * 3, ln, opts)
+            lx = W // 2 + W // 2 - w - 5 if align == "오른쪽" else W // 2 - w // 2
+            assert abs(im.getbbox()[2] - (lx + w)) <= tol
+
+
+def test_metrics_cache_roundtrip():
+    m = main.get_metrics(FONT, 14)
+    width = m.run_width("AVATAR")
+    main.save_metrics_cache()
+
+    main._METRICS.clear()
+    m = main.get_metrics(FONT, 14)
+    assert "A" in m.glyphs and not m.dirty
+    assert m.run_width("AVATAR") == width
+
+
+def test_metrics_cache_ignores_other_environment():
+    main.get_metrics(FONT, 14).run_width("AV")
+    main.save_metrics_cache()
+
+    main._METRICS.clear()
+    m = main.FontMetrics(FONT, 14)
+    m.header = dict(m.header, pillow="0.0")
+    m.glyphs = {}
+    m._load()
+    assert m.glyphs == {}
+
+
+
+def test_metrics_save_while_filling():
+    import threading
+
+    m = main.get_metrics(FONT, 14)
+    stop = threading.Event()
+    errors = []
+
+    def fill():
+        for cp in range(0x21, 0x2000):
+            if stop.is_set():
+                break
+            m.run_width(chr(cp) + "A")
+
+    def save():
+        try:
+            while not stop.is_set():
+                main.save_metrics_cache()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=fill), threading.Thread(target=save),
+               threading.Thread(target=save)]
+    for t in threads:
+        t.start()
+    threads[0].join()
+    stop.set()
+    for t in threads[1:]:
+        t.join()
+    main.save_metrics_cache()
+    assert errors == []
+    assert not m.dirty
+
+    main._METRICS.clear()
+    assert len(main.get_metrics(FONT, 14).glyphs) == len(m.glyphs)
+
+
+OPTS = dict(font_paths=(FONT, FONT), font_size=14, outline=2, bold_px=1, scale_x=1.15,
+            line_spacing=1.0, align="가운데", offx=0, offy=0, pixel_mode=False,
+            boss_mode=True, text_color=(255, 255, 255), outline_color=(0, 0, 0),
+            shadow=(1, 1, (0, 0, 0)))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_continues_after_failure(tmp_path, workers):
+    import json
+
+    src = tmp_path / "src"
+    src.mkdir()
+    for i in range(4):
+        Image.new("RGBA", (96, 32), (i * 40, 0, 0, 255)).save(src / f"c{i}.png")
+    (src / "broken.png").write_bytes(b"not a png")
+    (tmp_path / "en.json").write_text(json.dumps(
+        {"c0.png": "Card 0", "c1.png": "Card 1", "c2.png": 2, "c3.png": "Card 3",
+         "broken.png": "x"}), encoding="utf-8")
+    (tmp_path / "ko.json").write_text(json.dumps(
+        {"c0.png": "카드 0", "c1.png": "카드 1"}), encoding="utf-8")
+
+    seen = []
+    saved, failed = main.render_locale_batch(
+        str(src), [str(tmp_path / "en.json"), str(tmp_path / "ko.json")], OPTS,
+        workers=workers, progress=lambda done, total, p: seen.append((done, total)))
+
+    assert sorted((os.path.basename(p), loc) for p, loc, _ in failed) == [
+        ("broken.png", "en"), ("c2.png", "en")]
+    assert len(saved) == 5
+    assert os.path.exists(src / "output" / "ko" / "c1.png")
+    assert os.path.exists(src / "output" / "en" / "c3.png")
+    assert seen[-1] == (5, 5)
+
+
+
+@pytest.mark.parametrize("workers, isolate", [(1, False), (1, True), (2, False)])
+def test_batch_failure_is_per_locale(tmp_path, workers, isolate):
+    import json
+
+    src = tmp_path / "src"
+    src.mkdir()
+    Image.new("RGBA", (96, 32), (0, 0, 0, 255)).save(src / "c0.png")
+    tables = []
+    for locale, table in (("ko", {"c0.png": "카드"}), ("zz", {"c0.png": 2}),
+                          ("zzz", {"c0.png": "Card"})):
+        (tmp_path / f"{locale}.json").write_text(json.dumps(table), encoding="utf-8")
+        tables.append(str(tmp_path / f"{locale}.json"))
+
+    saved, failed = main.render_locale_batch(str(src), tables, OPTS, workers=workers,
+                                             isolate=isolate)
+
+    assert sorted(os.path.relpath(p, src / "output") for p in saved) == [
+        os.path.join("ko", "c0.png"), os.path.join("zzz", "c0.png")]
+    assert [(os.path.basename(p), loc) for p, loc, _ in failed] == [("c0.png", "zz")]
+    assert "strip" in failed[0][2]
+
+
+
+def _timed_render(src_path, jobs, opts):
+    """_batch_render_image 를 감싸서 시작/끝 시각을 기록 (fork 된 워커에서 실행)."""
+    import time
+
+    start = time.monotonic()
+    result = _real_batch_render(src_path, jobs, opts)
+    time.sleep(0.05)
+    log = os.path.join(os.path.dirname(src_path), "times.log")
+    with open(log, "a") as f:
+        f.write(f"{start} {time.monotonic()}\n")
+    return result
+
+
+_real_batch_render = main._batch_render_image
+
+
+@pytest.mark.parametrize("budget_images, expected_max", [(1, 1), (2, 2)])
+def test_batch_respects_memory_budget(tmp_path, monkeypatch, budget_images, expected_max):
+    import json, multiprocessing
+
+    if multiprocessing.get_start_method() != "fork":
+        pytest.skip("워커에 패치를 넘기려면 fork 필요")
+
+    src = tmp_path / "src"
+    src.mkdir()
+    for i in range(6):
+        Image.new("RGBA", (96, 32)).save(src / f"c{i}.png")
+    (tmp_path / "en.json").write_text(
+        json.dumps({f"c{i}.png": f"Card {i}" for i in range(6)}), encoding="utf-8")
+
+    monkeypatch.setattr(main, "_batch_render_image", _timed_render)
+    need = main.batch_image_bytes(96, 32, OPTS)
+    saved, failed = main.render_locale_batch(
+        str(src), [str(tmp_path / "en.json")], OPTS, workers=4,
+        memory_budget=need * budget_images)
+    assert len(saved) == 6 and failed == []
+
+    spans = [tuple(map(float, ln.split())) for ln in open(src / "times.log")]
+    overlap = max(sum(1 for a, b in spans if a <= t < b) for t, _ in spans)
+    assert overlap <= expected_max
+
+
+TEXT = "Hello <size 20>World</size> AVATAR\n<font 2>Gan<stretch 0.8>ondorf</stretch></font> <bold>x</bold>"
+
+
+@pytest.mark.parametrize("band_h", [None, 1, 17, 64])
+@pytest.mark.parametrize("boss", [False, True])
+@pytest.mark.parametrize("px_mode", [False, True])
+def test_streaming_matches_compose(tmp_path, px_mode, boss, band_h):
+    W, H = 300, 203
+    opts = dict(OPTS, pixel_mode=px_mode, boss_mode=boss)
+    src = tmp_path / "src.png"
+    Image.new("RGB", (W, H), (10, 200, 30)).quantize(8).save(src)   # P 모드 원본
+    bottom = main.open_boss_bottom(str(src))
+
+    full = main.compose_text_image(W, H, TEXT, opts, boss_bottom=bottom)
+    out = tmp_path / "out.png"
+    main.save_text_png_streaming(str(out), W, H, TEXT, opts, boss_bottom=bottom, band_h=band_h)
+    with Image.open(out) as st:
+        assert st.mode == "RGBA" and st.size == (W, H)
+        assert st.tobytes() == full.tobytes()
+
+
+def test_band_height_follows_pixel_budget():
+    for W in (64, 4096, 16384):
+        for px_mode in (False, True):
+            opts = dict(OPTS, pixel_mode=px_mode)
+            scale = 4 if px_mode else 1
+            band_h = main.stream_band_height(W, opts)
+            assert band_h >= 1
+            assert W * scale * band_h * scale <= max(main.STREAM_BAND_PIXELS, W * scale * scale)
+
+
+def test_preview_of_large_sheet_is_downscaled(monkeypatch):
+    monkeypatch.setattr(main, "STREAM_MIN_PIXELS", 1)
+    monkeypatch.setattr(main, "STREAM_BAND_PIXELS", 600 * 16 * 10)   # 밴드 10행
+    made = []
+    real_new = Image.new
+    monkeypatch.setattr(main.Image, "new", lambda mode, size, *a: made.append(size) or real_new(mode, size, *a))
+
+    opts = dict(OPTS, pixel_mode=True, boss_mode=False)
+    im = main.compose_text_preview(600, 400, TEXT, opts, 300, 300)
+    assert im.size == (300, 200)
+    assert max(w * h for w, h in made) <= main.STREAM_BAND_PIXELS
+
+
+def test_metrics_follow_replaced_font_file(tmp_path):
+    import shutil
+
+    path = tmp_path / "font.ttf"
+    shutil.copy(FONT, path)
+    first = main.get_metrics(str(path), 14)
+    assert main.get_metrics(str(path), 14) is first
+
+    with open(path, "ab") as f:   # 같은 경로, 다른 내용
+        f.write(b"\0" * 16)
+    second = main.get_metrics(str(path), 14)
+    assert second is not first
+    assert second.cache_path != first.cache_path